@@ -87,10 +87,7 @@ def scans_completed(self, total_scan_time: float) -> None:
 # Make TracebackException pickable for dataclasses.asdict() to work on ScanCommandError
 # It's hacky and not the right way to use copyreg, but works for our use case
 def _traceback_to_str(traceback: TracebackException) -> str:
-    exception_trace_as_str = ""
-    for line in traceback.format(chain=False):
-        exception_trace_as_str += line
-    return exception_trace_as_str
+    return "".join(traceback.format(chain=False))
 
 
 copyreg.pickle(TracebackException, _traceback_to_str)  # type: ignore
@@ -1,22 +1,38 @@
+import os
 import ssl
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from itertools import repeat
 from ssl import CertificateError
 from typing import Optional, List, cast
 
 import cryptography
 from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.serialization import Encoding
 from cryptography.x509 import ExtensionNotFound, ExtensionOID, Certificate, load_pem_x509_certificate
-from nassl._nassl import X509
-from nassl.cert_chain_verifier import CertificateChainVerifier, CertificateChainVerificationFailed
+from cryptography.x509.oid import ObjectIdentifier, SignatureAlgorithmOID
+from nassl._nassl import X509, OpenSSLError
+from nassl.cert_chain_verifier import CertificateChainVerificationFailed
 import nassl.ocsp_response
 
 from sslyze.plugins.certificate_info._certificate_utils import extract_dns_subject_alternative_names, get_common_names
 from sslyze.plugins.certificate_info._symantec import SymantecDistructTester
 from sslyze.plugins.certificate_info.trust_stores.trust_store import TrustStore
+from sslyze.plugins.certificate_info.trust_stores.trust_store_repository import TrustStoresRepository
+
+
+# Comparing OIDs avoids instantiating a hash object for every certificate, and does not fail on unknown algorithms
+_SHA1_SIGNATURE_ALGORITHM_OIDS = frozenset(
+    [
+        SignatureAlgorithmOID.RSA_WITH_SHA1,
+        ObjectIdentifier("1.3.14.3.2.29"),  # Alternate OID for RSA with SHA1 that is occasionally seen
+        SignatureAlgorithmOID.ECDSA_WITH_SHA1,
+        SignatureAlgorithmOID.DSA_WITH_SHA1,
+    ]
+)
 
 
 @dataclass(frozen=True)
@@ -111,8 +127,9 @@ class CertificateDeploymentAnalysisResult:
             (https://blog.qualys.com/ssllabs/2017/09/26/google-and-mozilla-deprecating-existing-symantec-certificates).
             ``None`` if the verified chain could not be built.
         ocsp_response: The OCSP response returned by the server. ``None`` if no response was sent by the server.
-        ocsp_response_is_trusted: ``True`` if the OCSP response is trusted using the Mozilla trust store.
-            ``None`` if no OCSP response was sent by the server.
+        ocsp_response_is_trusted: ``True`` if the OCSP response is trusted using the trust store that was used to
+            build ``verified_certificate_chain``. ``None`` if no OCSP response was sent by the server, if its status
+            is not successful, or if the verified chain could not be built.
 
     """
 
@@ -164,6 +181,9 @@ class CertificateDeploymentAnalyzer:
     Useful for checking a server's certificate chain without having to use the CertificateInfoPlugin.
     """
 
+    # Shared by all analyzers so that validating a chain against each trust store does not spawn new threads every time
+    _thread_pool = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2)
+
     def __init__(
         self,
         server_hostname: str,
@@ -178,8 +198,7 @@ def __init__(
 
     def perform(self) -> CertificateDeploymentAnalysisResult:
         received_certificate_chain = [
-            load_pem_x509_certificate(pem_cert.encode("ascii"), backend=default_backend())
-            for pem_cert in self.server_certificate_chain_as_pem
+            _load_pem_certificate(pem_cert) for pem_cert in self.server_certificate_chain_as_pem
         ]
         leaf_cert = received_certificate_chain[0]
 
@@ -214,13 +233,12 @@ def perform(self) -> CertificateDeploymentAnalysisResult:
                 previous_issuer = None
 
         # Check if the leaf certificate is Extended Validation
-        is_leaf_certificate_ev = False
-        for trust_store in self.trust_stores_for_validation:
-            if trust_store.ev_oids is None:
-                # We only have the EV OIDs for Mozilla - skip other stores
-                continue
-
-            is_leaf_certificate_ev = trust_store.is_certificate_extended_validation(leaf_cert)
+        # We only have the EV OIDs for Mozilla - skip other stores
+        is_leaf_certificate_ev = any(
+            trust_store.is_certificate_extended_validation(leaf_cert)
+            for trust_store in self.trust_stores_for_validation
+            if trust_store.ev_oids
+        )
 
         # Check for Signed Timestamps
         number_of_scts: Optional[int] = 0
@@ -238,10 +256,14 @@ def perform(self) -> CertificateDeploymentAnalysisResult:
             pass
 
         # Try to generate the verified certificate chain using each trust store
-        all_path_validation_results = []
-        for trust_store in self.trust_stores_for_validation:
-            path_validation_result = _verify_certificate_chain(self.server_certificate_chain_as_pem, trust_store)
-            all_path_validation_results.append(path_validation_result)
+        # The chain only needs to be parsed once as validation is done locally, without connecting to the server
+        server_chain_as_x509s = [X509(pem_cert) for pem_cert in self.server_certificate_chain_as_pem]
+        # Each result already contains the trust store that was used so there is no need to track which job is which
+        all_path_validation_results = list(
+            self._thread_pool.map(
+                _verify_certificate_chain, repeat(server_chain_as_x509s), self.trust_stores_for_validation
+            )
+        )
 
         # Keep one trust store that was able to build the verified chain to then run additional checks
         trust_store_that_can_build_verified_chain = None
@@ -260,6 +282,17 @@ def sort_function(path_validation: PathValidationResult) -> str:
                 verified_certificate_chain = path_validation_result.verified_certificate_chain
                 break
 
+        # Start checking if the OCSP response is trusted, on the thread pool while the other checks below run
+        ocsp_verification_future = None
+        if (
+            self.server_ocsp_response
+            and trust_store_that_can_build_verified_chain
+            and self.server_ocsp_response.status == nassl.ocsp_response.OcspResponseStatusEnum.SUCCESSFUL
+        ):
+            ocsp_verification_future = self._thread_pool.submit(
+                _verify_ocsp_response, self.server_ocsp_response, trust_store_that_can_build_verified_chain
+            )
+
         # Check if the anchor was sent by the server
         has_anchor_in_certificate_chain = None
         if verified_certificate_chain:
@@ -271,7 +304,7 @@ def sort_function(path_validation: PathValidationResult) -> str:
         if verified_certificate_chain:
             has_sha1_in_certificate_chain = False
             for cert in verified_certificate_chain[:-1]:
-                if isinstance(cert.signature_hash_algorithm, hashes.SHA1):
+                if cert.signature_algorithm_oid in _SHA1_SIGNATURE_ALGORITHM_OIDS:
                     has_sha1_in_certificate_chain = True
                     break
 
@@ -282,7 +315,6 @@ def sort_function(path_validation: PathValidationResult) -> str:
             verified_chain_has_legacy_symantec_anchor = True if symantec_distrust_timeline else False
 
         # Check the OCSP response if there is one
-        is_ocsp_response_trusted = None
         final_ocsp_response = None
         if self.server_ocsp_response:
             # Convert the OCSP response from the nassl class to the sslyze class to ensure API stability
@@ -302,16 +334,9 @@ def sort_function(path_validation: PathValidationResult) -> str:
                 extensions=self.server_ocsp_response.extensions,
             )
 
-            # Check if the OCSP response is trusted
-            if (
-                trust_store_that_can_build_verified_chain
-                and self.server_ocsp_response.status == nassl.ocsp_response.OcspResponseStatusEnum.SUCCESSFUL
-            ):
-                try:
-                    self.server_ocsp_response.verify(trust_store_that_can_build_verified_chain.path)
-                    is_ocsp_response_trusted = True
-                except nassl.ocsp_response.OcspResponseNotTrustedError:
-                    is_ocsp_response_trusted = False
+        is_ocsp_response_trusted = None
+        if ocsp_verification_future:
+            is_ocsp_response_trusted = ocsp_verification_future.result()
 
         # All done
         return CertificateDeploymentAnalysisResult(
@@ -346,18 +371,31 @@ def _certificate_matches_hostname(certificate: Certificate, server_hostname: str
         return False
 
 
-def _verify_certificate_chain(server_certificate_chain: List[str], trust_store: TrustStore) -> PathValidationResult:
-    server_chain_as_x509s = [X509(pem_cert) for pem_cert in server_certificate_chain]
-    chain_verifier = CertificateChainVerifier.from_file(trust_store.path)
+def _verify_ocsp_response(ocsp_response: nassl.ocsp_response.OcspResponse, trust_store: TrustStore) -> bool:
+    try:
+        ocsp_response.verify(trust_store.path)
+        return True
+    except (nassl.ocsp_response.OcspResponseNotTrustedError, OpenSSLError):
+        # Any other OpenSSL error (such as a malformed responder certificate) also means it is not trusted
+        return False
+
+
+# Cached as most servers share the same intermediate certificates and trust store anchors, which therefore only need to
+# be parsed once; certificates are immutable so the same instance can be returned to multiple scans
+@lru_cache(maxsize=1024)
+def _load_pem_certificate(pem_cert: str) -> Certificate:
+    return load_pem_x509_certificate(pem_cert.encode("ascii"), backend=default_backend())
+
+
+def _verify_certificate_chain(server_chain_as_x509s: List[X509], trust_store: TrustStore) -> PathValidationResult:
+    chain_verifier = TrustStoresRepository.get_certificate_chain_verifier(trust_store)
 
     verified_chain: Optional[List[Certificate]]
     try:
         openssl_verify_str = None
         verified_chain_as_509s = chain_verifier.verify(server_chain_as_x509s)
-        verified_chain = [
-            load_pem_x509_certificate(x509_cert.as_pem().encode("ascii"), backend=default_backend())
-            for x509_cert in verified_chain_as_509s
-        ]
+        # The certificates sent by the server were already parsed so they will be retrieved from the cache
+        verified_chain = [_load_pem_certificate(x509_cert.as_pem()) for x509_cert in verified_chain_as_509s]
     except CertificateChainVerificationFailed as e:
         verified_chain = None
         openssl_verify_str = e.openssl_error_string
@@ -68,7 +68,6 @@ def find_cli_options_in_command_line(
     def register_json_serializer_functions(cls) -> None:
         register_json_serializer_functions()
 
-    TRUST_FORMAT = "{store_name} CA Store ({store_version}):"
     NO_VERIFIED_CHAIN_ERROR_TXT = "ERROR - Could not build verified chain (certificate untrusted?)"
 
     @classmethod
@@ -105,9 +104,9 @@ def _cert_deployment_to_console_output(
         deployment_as_txt.append(cls._format_subtitle(f"Certificate #{index} - Trust"))
 
         hostname_validation_text = (
-            f"OK - Certificate matches server hostname"
+            "OK - Certificate matches server hostname"
             if cert_deployment.leaf_certificate_subject_matches_hostname
-            else f"FAILED - Certificate does NOT match server hostname"
+            else "FAILED - Certificate does NOT match server hostname"
         )
         deployment_as_txt.append(cls._format_field("Hostname Validation:", hostname_validation_text))
 
@@ -123,13 +122,9 @@ def _cert_deployment_to_console_output(
             else:
                 path_txt = f"FAILED - Certificate is NOT Trusted: {path_result.openssl_error_string}"
 
+            trust_store = path_result.trust_store
             deployment_as_txt.append(
-                cls._format_field(
-                    cls.TRUST_FORMAT.format(
-                        store_name=path_result.trust_store.name, store_version=path_result.trust_store.version
-                    ),
-                    path_txt,
-                )
+                cls._format_field(f"{trust_store.name} CA Store ({trust_store.version}):", path_txt)
             )
 
         if cert_deployment.verified_chain_has_legacy_symantec_anchor is None:
@@ -156,16 +151,16 @@ def _cert_deployment_to_console_output(
         deployment_as_txt.append(cls._format_field("Received Chain:", " --> ".join(cns_in_received_chain)))
 
         # Print the Common Names within the verified certificate chain if validation was successful
-        if cert_deployment.verified_certificate_chain:
-            cns_in_certificate_chain = [
-                _get_name_as_short_text(cert.subject) for cert in cert_deployment.verified_certificate_chain
-            ]
-            verified_chain_txt = " --> ".join(cns_in_certificate_chain)
+        verified_certificate_chain = cert_deployment.verified_certificate_chain
+        if verified_certificate_chain:
+            verified_chain_txt = " --> ".join(
+                _get_name_as_short_text(cert.subject) for cert in verified_certificate_chain
+            )
         else:
             verified_chain_txt = cls.NO_VERIFIED_CHAIN_ERROR_TXT
         deployment_as_txt.append(cls._format_field("Verified Chain:", verified_chain_txt))
 
-        if cert_deployment.verified_certificate_chain:
+        if verified_certificate_chain:
             chain_with_anchor_txt = (
                 "OK - Anchor certificate not sent"
                 if not cert_deployment.received_chain_contains_anchor_certificate
@@ -182,7 +177,7 @@ def _cert_deployment_to_console_output(
         )
         deployment_as_txt.append(cls._format_field("Received Chain Order:", chain_order_txt))
 
-        if cert_deployment.verified_certificate_chain:
+        if verified_certificate_chain:
             sha1_text = (
                 "OK - No SHA1-signed certificate in the verified certificate chain"
                 if not cert_deployment.verified_chain_has_sha1_signature
@@ -210,53 +205,43 @@ def _cert_deployment_to_console_output(
         elif scts_count == 0:
             sct_txt = "NOT SUPPORTED - Extension not found"
         elif scts_count < 3:
-            sct_txt = "WARNING - Only {} SCTs included but Google recommends 3 or more".format(str(scts_count))
+            sct_txt = f"WARNING - Only {scts_count} SCTs included but Google recommends 3 or more"
         else:
-            sct_txt = "OK - {} SCTs included".format(str(scts_count))
+            sct_txt = f"OK - {scts_count} SCTs included"
         deployment_as_txt.append(cls._format_field("Certificate Transparency:", sct_txt))
 
         # OCSP stapling
         deployment_as_txt.extend(["", cls._format_subtitle(f"Certificate #{index} - OCSP Stapling")])
 
-        if cert_deployment.ocsp_response is None:
+        ocsp_response = cert_deployment.ocsp_response
+        if ocsp_response is None:
             deployment_as_txt.append(cls._format_field("", "NOT SUPPORTED - Server did not send back an OCSP response"))
 
         else:
-            if cert_deployment.ocsp_response.status != OcspResponseStatusEnum.SUCCESSFUL:
+            if ocsp_response.status != OcspResponseStatusEnum.SUCCESSFUL:
                 ocsp_resp_txt = [
                     cls._format_field(
-                        "",
-                        "ERROR - OCSP response status is not successful: {}".format(
-                            cert_deployment.ocsp_response.status.name
-                        ),
+                        "", f"ERROR - OCSP response status is not successful: {ocsp_response.status.name}"
                     )
                 ]
             else:
-                ocsp_trust_txt = (
-                    "OK - Response is trusted"
-                    if cert_deployment.ocsp_response_is_trusted
-                    else "FAILED - Response is NOT trusted"
-                )
+                # The response was validated with the trust store that built the verified chain, if any
+                if cert_deployment.ocsp_response_is_trusted is None:
+                    ocsp_trust_txt = cls.NO_VERIFIED_CHAIN_ERROR_TXT
+                elif cert_deployment.ocsp_response_is_trusted:
+                    ocsp_trust_txt = "OK - Response is trusted"
+                else:
+                    ocsp_trust_txt = "FAILED - Response is NOT trusted"
 
                 ocsp_resp_txt = [
-                    cls._format_field("OCSP Response Status:", cert_deployment.ocsp_response.status.name),
-                    cls._format_field("Validation w/ Mozilla Store:", ocsp_trust_txt),
-                    cls._format_field("Responder Id:", cert_deployment.ocsp_response.responder_id),
+                    cls._format_field("OCSP Response Status:", ocsp_response.status.name),
+                    cls._format_field("Response Validation:", ocsp_trust_txt),
+                    cls._format_field("Responder Id:", ocsp_response.responder_id),
+                    cls._format_field("Cert Status:", ocsp_response.certificate_status),
+                    cls._format_field("Cert Serial Number:", ocsp_response.serial_number),
+                    cls._format_field("This Update:", ocsp_response.this_update.date().isoformat()),
+                    cls._format_field("Next Update:", ocsp_response.next_update.date().isoformat()),
                 ]
-
-                if cert_deployment.ocsp_response.status == OcspResponseStatusEnum.SUCCESSFUL:
-                    ocsp_resp_txt.extend(
-                        [
-                            cls._format_field("Cert Status:", cert_deployment.ocsp_response.certificate_status),
-                            cls._format_field("Cert Serial Number:", cert_deployment.ocsp_response.serial_number),
-                            cls._format_field(
-                                "This Update:", cert_deployment.ocsp_response.this_update.date().isoformat()
-                            ),
-                            cls._format_field(
-                                "Next Update:", cert_deployment.ocsp_response.next_update.date().isoformat()
-                            ),
-                        ]
-                    )
             deployment_as_txt.extend(ocsp_resp_txt)
 
         # All done
@@ -264,6 +249,7 @@ def _cert_deployment_to_console_output(
 
     @classmethod
     def _get_basic_certificate_text(cls, certificate: Certificate) -> List[str]:
+        public_key = certificate.public_key()
         text_output = [
             cls._format_field(
                 "SHA1 Fingerprint:", binascii.hexlify(certificate.fingerprint(hashes.SHA1())).decode("ascii")
@@ -274,10 +260,9 @@ def _get_basic_certificate_text(cls, certificate: Certificate) -> List[str]:
             cls._format_field("Not Before:", certificate.not_valid_before.date().isoformat()),
             cls._format_field("Not After:", certificate.not_valid_after.date().isoformat()),
             cls._format_field("Signature Algorithm:", certificate.signature_hash_algorithm.name),
-            cls._format_field("Public Key Algorithm:", certificate.public_key().__class__.__name__),
+            cls._format_field("Public Key Algorithm:", public_key.__class__.__name__),
         ]
 
-        public_key = certificate.public_key()
         if isinstance(public_key, EllipticCurvePublicKey):
             text_output.append(cls._format_field("Key Size:", str(public_key.curve.key_size)))
             text_output.append(cls._format_field("Curve:", str(public_key.curve.name)))
@@ -5,7 +5,6 @@
 from typing import Dict, Any, List, Optional
 
 from cryptography import x509
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.backends.openssl.x509 import _Certificate
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
 from cryptography.hazmat.primitives.serialization import Encoding
@@ -31,8 +30,10 @@ def register_json_serializer_functions() -> None:
     # that contains a _Certificate, asdict() succeeds. Without this, generating JSON for the certinfo scan command
     # will crash because the asdict() function uses deepcopy(), but certificates returned by cryptography.x509
     # don't support it so SSLyze would crash. This class is a workaround to fix JSON output.
+    # Certificates are immutable so the "copy" can be the certificate itself, which avoids re-parsing every certificate
+    # (via a PEM round-trip) each time a result gets converted to a dictionary.
     def _deepcopy_method_for_x509_certificate(inner_self: _Certificate, memo: str) -> x509.Certificate:
-        return x509.load_pem_x509_certificate(inner_self.public_bytes(Encoding.PEM), backend=default_backend())
+        return inner_self
 
     _Certificate.__deepcopy__ = _deepcopy_method_for_x509_certificate
 
@@ -11,9 +11,10 @@
 from os.path import realpath
 
 from cryptography.hazmat._oid import ObjectIdentifier
+from nassl.cert_chain_verifier import CertificateChainVerifier
 
 from sslyze.plugins.certificate_info.trust_stores.trust_store import TrustStore
-from typing import List
+from typing import List, Dict
 
 
 class TrustStoreEnum(Enum):
@@ -47,6 +48,10 @@ class TrustStoresRepository:
 
     _DEFAULT_REPOSITORY = None  # Singleton we use to avoid parsing the trust stores over and over
 
+    # Trust store path => verifier with the store's root certificates already loaded, to avoid re-parsing the PEM file
+    # every time a certificate chain gets validated; only populated with the default trust stores
+    _CHAIN_VERIFIERS_CACHE: Dict[Path, CertificateChainVerifier] = {}
+
     _STORE_PRETTY_NAMES = {
         TrustStoreEnum.APPLE: "Apple",
         TrustStoreEnum.GOOGLE_AOSP: "Android",
@@ -98,6 +103,23 @@ def get_default(cls) -> "TrustStoresRepository":
             cls._DEFAULT_REPOSITORY = cls(cls._DEFAULT_TRUST_STORES_PATH)
         return cls._DEFAULT_REPOSITORY
 
+    @classmethod
+    def get_certificate_chain_verifier(cls, trust_store: TrustStore) -> CertificateChainVerifier:
+        """Get a verifier for validating certificate chains against the supplied trust store.
+
+        For the default trust stores, the PEM file is only parsed the first time the verifier is requested.
+        """
+        if trust_store.path.parent != cls._DEFAULT_TRUST_STORES_PATH:
+            # A custom trust store (such as a CA file supplied by the user) may be modified between scans
+            return CertificateChainVerifier.from_file(trust_store.path)
+
+        # Not thread-safe but the worst case is that the same PEM file gets parsed more than once
+        chain_verifier = cls._CHAIN_VERIFIERS_CACHE.get(trust_store.path)
+        if chain_verifier is None:
+            chain_verifier = CertificateChainVerifier.from_file(trust_store.path)
+            cls._CHAIN_VERIFIERS_CACHE[trust_store.path] = chain_verifier
+        return chain_verifier
+
     _UPDATE_URL = "https://nabla-c0d3.github.io/trust_stores_observatory/trust_stores_as_pem.tar.gz"
 
     # TODO(AD): Move this to the trust_store_observatory
@@ -124,6 +146,7 @@ def update_default(cls) -> "TrustStoresRepository":
             shutil.rmtree(temp_path)
 
         # Re-generate the default repo - not thread-safe
+        cls._CHAIN_VERIFIERS_CACHE.clear()
         cls._DEFAULT_REPOSITORY = cls(cls._DEFAULT_TRUST_STORES_PATH)
         return cls._DEFAULT_REPOSITORY
 
@@ -1,4 +1,16 @@
-from sslyze.plugins.certificate_info.implementation import CertificateInfoImplementation
+from datetime import datetime
+from pathlib import Path
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.x509 import load_pem_x509_certificate
+
+from sslyze.plugins.certificate_info._cert_chain_analyzer import (
+    CertificateDeploymentAnalysisResult,
+    OcspResponse,
+    OcspResponseStatusEnum,
+)
+from sslyze.plugins.certificate_info._cli_connector import _CertificateInfoCliConnector
+from sslyze.plugins.certificate_info.implementation import CertificateInfoImplementation, CertificateInfoScanResult
 from sslyze.server_connectivity import ServerConnectivityTester
 from sslyze.server_setting import ServerNetworkLocationViaDirectConnection
 
@@ -13,3 +25,49 @@ def test(self):
         # When generating the CLI output for this result, it succeeds
         result_as_txt = CertificateInfoImplementation.cli_connector_cls.result_to_console_output(plugin_result)
         assert result_as_txt
+
+    def test_ocsp_response_without_verified_chain(self):
+        # Given a certificate deployment with an OCSP response but for which no verified chain could be built
+        leaf_path = Path(__file__).absolute().parent / ".." / ".." / "certificates" / "github.com.pem"
+        leaf_certificate = load_pem_x509_certificate(leaf_path.read_bytes(), default_backend())
+        ocsp_response = OcspResponse(
+            status=OcspResponseStatusEnum.SUCCESSFUL,
+            type="Basic OCSP Response",
+            version=1,
+            responder_id="responder",
+            produced_at=datetime(2020, 1, 1),
+            certificate_status="good",
+            this_update=datetime(2020, 1, 1),
+            next_update=datetime(2020, 1, 8),
+            hash_algorithm="sha1",
+            issuer_name_hash="issuer name hash",
+            issuer_key_hash="issuer key hash",
+            serial_number="1234",
+            extensions=None,
+        )
+        cert_deployment = CertificateDeploymentAnalysisResult(
+            received_certificate_chain=[leaf_certificate],
+            leaf_certificate_subject_matches_hostname=True,
+            leaf_certificate_has_must_staple_extension=False,
+            leaf_certificate_is_ev=False,
+            leaf_certificate_signed_certificate_timestamps_count=0,
+            received_chain_contains_anchor_certificate=None,
+            received_chain_has_valid_order=True,
+            path_validation_results=[],
+            verified_chain_has_sha1_signature=None,
+            verified_chain_has_legacy_symantec_anchor=None,
+            ocsp_response=ocsp_response,
+            ocsp_response_is_trusted=None,
+        )
+        plugin_result = CertificateInfoScanResult(
+            hostname_used_for_server_name_indication="github.com", certificate_deployments=[cert_deployment]
+        )
+
+        # When generating the CLI output for this result
+        result_as_txt = _CertificateInfoCliConnector.result_to_console_output(plugin_result)
+
+        # Then the OCSP response is not reported as untrusted, but as not validated
+        ocsp_validation_lines = [line for line in result_as_txt if "Response Validation:" in line]
+        assert len(ocsp_validation_lines) == 1
+        assert _CertificateInfoCliConnector.NO_VERIFIED_CHAIN_ERROR_TXT in ocsp_validation_lines[0]
+        assert "FAILED" not in ocsp_validation_lines[0]
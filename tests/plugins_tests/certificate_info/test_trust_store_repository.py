@@ -1,3 +1,6 @@
+from pathlib import Path
+
+from sslyze.plugins.certificate_info.trust_stores.trust_store import TrustStore
 from sslyze.plugins.certificate_info.trust_stores.trust_store_repository import TrustStoresRepository
 
 
@@ -11,3 +14,26 @@ def test_update_default(self):
         repo = TrustStoresRepository.update_default()
         assert repo.get_main_store()
         assert len(repo.get_all_stores()) == 5
+
+    def test_get_certificate_chain_verifier(self):
+        # Given a trust store
+        trust_store = TrustStoresRepository.get_default().get_main_store()
+
+        # When retrieving the corresponding certificate chain verifier, it succeeds
+        chain_verifier = TrustStoresRepository.get_certificate_chain_verifier(trust_store)
+        assert chain_verifier
+
+        # And the verifier is re-used when retrieving it again, instead of re-parsing the trust store
+        assert chain_verifier is TrustStoresRepository.get_certificate_chain_verifier(trust_store)
+
+    def test_get_certificate_chain_verifier_custom_trust_store(self):
+        # Given a custom trust store, which could be modified between scans
+        ca_file_path = Path(__file__).absolute().parent / ".." / ".." / "certificates" / "github.com.pem"
+        trust_store = TrustStore(ca_file_path, "Supplied CA file", "N/A")
+
+        # When retrieving the corresponding certificate chain verifier, it succeeds
+        chain_verifier = TrustStoresRepository.get_certificate_chain_verifier(trust_store)
+        assert chain_verifier
+
+        # And the trust store gets re-parsed when retrieving the verifier again
+        assert chain_verifier is not TrustStoresRepository.get_certificate_chain_verifier(trust_store)